@@ -1,25 +1,89 @@
 import os
+import threading
+
+import numpy as np
+import orjson
 import pandas as pd
+from flask_caching import Cache
+from joblib import Parallel, delayed
+from numba import njit, prange
+import plotly.io as pio
 import plotly.express as px
-from dash import Dash, dcc, html
+from dash import Dash, dcc, html, Input, Output
+
+# orjson is ~3-5x faster than stdlib json on datetime-heavy figure payloads;
+# this speeds both the figure cache serialization and Dash's response encoding
+pio.json.config.default_engine = "orjson"
 import dash_bootstrap_components as dbc
-import plotly.graph_objects as go
 from plotly.subplots import make_subplots
 
+# --- Reporting window (charts cover 2025 onwards) ---
+CUTOFF = np.datetime64("2025-01-01")
+PRE_CUTOFF = np.datetime64("2024-12-31")
+
+# --- Cache setup ---
+EXCEL_PATH = "Sharp Token.xlsx"
+CACHE_DIR = "cache"
+# Only the columns each chart actually reads; None keeps every column
+# (referral campaigns and token sources are discovered from the sheet)
+SHEET_USECOLS = {
+    "Referrals": None,
+    "Wallets Created": ["Date", "Android", "iOS", "Web"],
+    "POL Data": ["Date", "TxnFee(POL)"],
+    "Tokens per source": None,
+}
+SHEETS = list(SHEET_USECOLS)
+
+os.makedirs(CACHE_DIR, exist_ok=True)
+CACHE_KEY = int(os.path.getmtime(EXCEL_PATH))
+
+# Redis in deployment (REDIS_URL set on Render), filesystem cache locally
+if "REDIS_URL" in os.environ:
+    CACHE_CONFIG = {"CACHE_TYPE": "RedisCache", "CACHE_REDIS_URL": os.environ["REDIS_URL"]}
+else:
+    CACHE_CONFIG = {"CACHE_TYPE": "FileSystemCache", "CACHE_DIR": os.path.join(CACHE_DIR, "figures")}
+
+
+def downcast_numerics(frame):
+    """Shrink float64 columns to the smallest integer/float dtype that fits."""
+    for col in frame.select_dtypes("float64").columns:
+        frame[col] = pd.to_numeric(frame[col], downcast="integer")
+        if frame[col].dtype == "float64":
+            frame[col] = pd.to_numeric(frame[col], downcast="float")
+    return frame
+
+
+def load_sheets():
+    """Load the workbook sheets, via per-sheet Parquet caches keyed by file mtime."""
+    cached = {
+        sheet: os.path.join(CACHE_DIR, f"{CACHE_KEY}_{sheet.replace(' ', '_')}.parquet")
+        for sheet in SHEETS
+    }
+    if all(os.path.exists(path) for path in cached.values()):
+        return {sheet: pd.read_parquet(path, engine="pyarrow") for sheet, path in cached.items()}
+    with pd.ExcelFile(EXCEL_PATH, engine="calamine") as xls:
+        sheet_names = {name.strip(): name for name in xls.sheet_names}
+        raw = {
+            sheet: xls.parse(sheet_names[sheet], usecols=SHEET_USECOLS[sheet])
+            for sheet in SHEETS
+        }
+    for sheet, path in cached.items():
+        downcast_numerics(raw[sheet]).to_parquet(path, engine="pyarrow")
+    return raw
+
+
 # --- Load data ---
-df = {k.strip(): v for k, v in pd.read_excel("Sharp Token.xlsx", sheet_name=None).items()}
+df = load_sheets()
 
 referral_df = df["Referrals"]
 wallet_df = df["Wallets Created"]
 fee_df = df["POL Data"]
 
-tokens_source_df = pd.read_excel("Sharp Token.xlsx", sheet_name="Tokens per source")
+tokens_source_df = df["Tokens per source"]
 tokens_source_df["Date"] = pd.to_datetime(
     tokens_source_df["Date"], format="%m-%d-%Y", errors="coerce"
-)
+).dt.normalize()  # strip time in vectorized C, no Python date objects
 tokens_source_df.dropna(subset=["Date"], inplace=True)
-tokens_source_df["Date"] = tokens_source_df["Date"].dt.date  # strip time
-tokens_source_df["Date"] = pd.to_datetime(tokens_source_df["Date"])  # convert back to datetime
 
 # --- Clean and prep data ---
 for df_ in [wallet_df, referral_df, fee_df]:
@@ -28,23 +92,39 @@ for df_ in [wallet_df, referral_df, fee_df]:
         df_.dropna(subset=["Date"], inplace=True)
 
 referral_sources = [ col for col in referral_df.columns if col != "Date" and pd.api.types.is_numeric_dtype(referral_df[col])]
-referral_df["Referrals"] = referral_df[referral_sources].sum(axis=1)
+# single reduction over the 2-D ndarray view; na_value=0 matches pandas' NaN-skipping sum
+referral_df["Referrals"] = referral_df[referral_sources].to_numpy(dtype=np.float32, na_value=0).sum(axis=1)
 
-# --- Precompute Figures ---
-def create_figures():
-    # --- Token Charts ---
-    tsdf = tokens_source_df[tokens_source_df["Date"] >= "2025-01-01"].copy()
-    token_source_cols = [
-        col for col in tsdf.select_dtypes(include="number").columns if col != "Total"
-    ]
-    monthly_tokens = tsdf.resample("MS", on="Date").sum(numeric_only=True).reset_index()
-    monthly_tokens["Month"] = monthly_tokens["Date"]  # Keep this for time-based charts
-    monthly_tokens["MonthLabel"] = monthly_tokens["Date"].dt.strftime("%B %Y")  # For display only
+@njit(parallel=True, cache=True)
+def _month_sum_kernel(codes, values, ngroups):
+    out = np.zeros((ngroups, values.shape[1]))
+    for j in prange(values.shape[1]):
+        for i in range(values.shape[0]):
+            out[codes[i], j] += values[i, j]
+    return out
+
+
+def month_sum(frame, value_cols):
+    """Sum value_cols per calendar month with a parallel numba kernel."""
+    frame = frame.sort_values("Date")
+    months = frame["Date"].to_numpy().astype("datetime64[M]")
+    codes, month_starts = pd.factorize(months)
+    # na_value=0 mirrors groupby.sum, which treats NaN cells as zero
+    sums = _month_sum_kernel(codes, frame[value_cols].to_numpy(na_value=0), len(month_starts))
+    out = pd.DataFrame(sums, columns=value_cols)
+    out.insert(0, "Month", pd.DatetimeIndex(month_starts.astype("datetime64[ns]")))
+    return out
+
+
+# Prime the kernel from the main thread: numba's parallel runtime hangs
+# interpreter shutdown if its first launch happens on a background thread.
+_month_sum_kernel(np.zeros(1, dtype=np.int64), np.zeros((1, 1)), 1)
 
-    if "Total" not in monthly_tokens.columns:
-        monthly_tokens["Total"] = monthly_tokens[token_source_cols].sum(axis=1)
-    total_tokens = monthly_tokens["Total"].sum()
 
+# --- Precompute Figures ---
+# One builder per figure; each takes pre-aggregated data so create_figures can
+# dispatch them in parallel once the shared scans are done.
+def _build_token_bar(monthly_tokens, total_tokens):
     token_bar = px.bar(
         monthly_tokens,
         x="Month",
@@ -54,7 +134,10 @@ def create_figures():
     )
     token_bar.update_traces(texttemplate="%{text:,.0f}", textposition="auto")
     token_bar.update_layout(xaxis_tickangle=-45)
+    return token_bar
+
 
+def _build_token_line(monthly_tokens, total_tokens):
     token_line = px.line(
         monthly_tokens,
         x="Month",
@@ -67,25 +150,15 @@ def create_figures():
         showlegend=True,
         legend=dict(title="Legend", x=0.8, y=1, traceorder="normal", orientation="v"),
     )
+    return token_line
 
-    # --- Wallet Charts ---
-    wallet_df_filtered = wallet_df[wallet_df["Date"] > "2024-12-31"].copy()
-    wallet_df_filtered["Month"] = (wallet_df_filtered["Date"].dt.to_period("M").dt.to_timestamp())
-    monthly_wallets = (wallet_df_filtered.groupby("Month")[["Android", "iOS", "Web"]].sum().reset_index())
-    platform_totals = monthly_wallets[["Android", "iOS", "Web"]].sum().astype(int)
-
-    wallets_melted = monthly_wallets.melt(
-        id_vars="Month",
-        value_vars=["Android", "iOS", "Web"],
-        var_name="Platform",
-        value_name="Count",
-    )
 
+def _build_wallet_bar(monthly_wallets, platform_totals):
     wallet_bar = px.bar(
-        wallets_melted,
+        monthly_wallets,
         x="Month",
-        y="Count",
-        color="Platform",
+        y=["Android", "iOS", "Web"],
+        labels={"variable": "Platform", "value": "Count"},
         barmode="group",
         title=(
             f"Monthly Wallet Creation by Platform<br>"
@@ -96,7 +169,10 @@ def create_figures():
         ),
     )
     wallet_bar.update_layout(xaxis_tickangle=-45)
+    return wallet_bar
+
 
+def _build_wallet_pie(platform_totals):
     wallet_pie = px.pie(
         names=platform_totals.index,
         values=platform_totals.values,
@@ -109,43 +185,36 @@ def create_figures():
             f'Web: {platform_totals["Web"]:,}'
         ),
     )
+    return wallet_pie
 
-    # --- Referrals ---
-    rdf = referral_df[referral_df["Date"] >= "2025-01-01"].copy()
-    rdf["Month"] = rdf["Date"].dt.to_period("M").dt.to_timestamp()
-    referral_by_source = rdf.groupby("Month")[referral_sources].sum().reset_index()
-    referral_totals = referral_by_source[referral_sources].sum().astype(int)
 
-    referral_melted = referral_by_source.melt(
-        id_vars="Month",
-        value_vars=referral_sources,
-        var_name="Campaign",
-        value_name="Referrals",
-    )
+def _build_referral_bar(referral_by_source, referral_totals):
     referral_bar = px.bar(
-        referral_melted,
+        referral_by_source,
         x="Month",
-        y="Referrals",
-        color="Campaign",
+        y=referral_sources,
+        labels={"variable": "Campaign", "value": "Referrals"},
         title=f"Monthly Referrals by Source (Total: {referral_totals.sum():,})",
         barmode="stack",
         color_discrete_sequence=px.colors.qualitative.Vivid,  # 👈 more distinct colors
     )
     # Add total labels above each stacked bar
-    referral_totals_by_month = referral_melted.groupby("Month")["Referrals"].sum().reset_index()
-    
+    # dict traces skip graph-object property validation (trusted, hard-coded inputs)
     referral_bar.add_trace(
-        go.Scatter(
-            x=referral_totals_by_month["Month"],
-            y=referral_totals_by_month["Referrals"],
-            text=referral_totals_by_month["Referrals"].apply(lambda x: f"{int(x):,}"),
+        dict(
+            type="scatter",
+            x=referral_by_source["Month"],
+            y=referral_by_source["Total"],
+            text=[f"{int(v):,}" for v in referral_by_source["Total"].to_numpy()],
             mode="text",
             textposition="top center",
             showlegend=False,
         )
     )
+    return referral_bar
 
-    referral_by_source["Total"] = referral_by_source[referral_sources].sum(axis=1)
+
+def _build_referral_line(referral_by_source):
     referral_line = px.line(
         referral_by_source,
         x="Month",
@@ -153,13 +222,10 @@ def create_figures():
         title="Monthly Total Referrals Over Time (From Jan 2025)",
         markers=True,
     )
+    return referral_line
 
-    # --- Fee Chart ---
-    fdf = fee_df[fee_df["Date"] > "2024-12-31"].copy()
-    fdf["Month"] = fdf["Date"].dt.to_period("M").dt.to_timestamp()
-    monthly_fee = fdf.groupby("Month")["TxnFee(POL)"].sum().reset_index()
-    total_fee = int(monthly_fee["TxnFee(POL)"].sum())
 
+def _build_fee_line(monthly_fee, total_fee):
     fee_line = px.line(
         monthly_fee,
         x="Month",
@@ -167,22 +233,28 @@ def create_figures():
         title=f"Transaction Fee Trends by Month (Total: {total_fee:,} POL)",
         markers=True,
     )
+    return fee_line
 
-    # --- Total Tokens by Source (Horizontal Bar) ---
-    total_tokens = tokens_source_df[token_source_cols].sum().reset_index()
-    total_tokens.columns = ["Source", "Total Tokens"]
+
+def _build_token_source_bar(source_totals):
+    # ordered Categorical + explicit category_orders lets Plotly skip its own
+    # per-render string sort of the axis labels
+    source_totals = source_totals.sort_values("Total Tokens", ascending=False)
+    source_order = source_totals["Source"].tolist()
+    source_totals["Source"] = pd.Categorical(source_totals["Source"], categories=source_order, ordered=True)
 
     token_source_bar = px.bar(
-        total_tokens,
+        source_totals,
         x="Total Tokens",
         y="Source",
         orientation="h",
         color="Source",
-        title=f'Total Tokens by Source (Total: {int(total_tokens["Total Tokens"].sum()):,})',
+        category_orders={"Source": source_order},
+        title=f'Total Tokens by Source (Total: {int(source_totals["Total Tokens"].sum()):,})',
         color_discrete_sequence=px.colors.qualitative.Set3,
     )
     token_source_bar.update_traces(
-        text=total_tokens["Total Tokens"],
+        text=source_totals["Total Tokens"],
         texttemplate="%{x:,.0f}",
         insidetextanchor="middle",
     )
@@ -193,22 +265,10 @@ def create_figures():
         bargap=0.15,
         bargroupgap=0.1,
     )
+    return token_source_bar
 
-    # --- Monthly Tokens by Source (Pie Subplots) ---
-    tsdf = tokens_source_df.copy()
-    tsdf["Date"] = pd.to_datetime(tsdf["Date"], errors="coerce")
-    tsdf = tsdf[tsdf["Date"] >= "2025-01-01"].dropna(subset=["Date"])
-    tsdf["Month_dt"] = tsdf["Date"].dt.to_period("M").dt.to_timestamp()
-    tsdf["Month"] = tsdf["Month_dt"].dt.strftime("%b %Y")
-    tsdf = tsdf.sort_values("Month_dt")
-    month_order = tsdf["Month"].unique().tolist()
-    tsdf["Month"] = pd.Categorical(tsdf["Month"], categories=month_order, ordered=True)
 
-    token_source_cols = [ col for col in tsdf.columns if col not in ["Date", "Month_dt", "Month", "Total"] and pd.api.types.is_numeric_dtype(tsdf[col]) ]
-    melted = tsdf.melt( id_vars="Month", value_vars=token_source_cols, var_name="Source", value_name="Tokens",)
-    monthly_data = (melted.groupby(["Month", "Source"], observed=True).sum().reset_index())
-    months = monthly_data["Month"].cat.categories.tolist()
-    month_totals = (monthly_data.groupby("Month", observed=True)["Tokens"].sum().to_dict())
+def _build_fig_pies(monthly_data, months, month_totals):
     subplot_titles = [f"{m}" for m in months]
 
     fig_pies = make_subplots(
@@ -217,46 +277,103 @@ def create_figures():
         specs=[[{"type": "domain"}] * len(months)],
         subplot_titles=subplot_titles,
     )
-    annotations = []
-    for i, month in enumerate(months):
-        sub_df = monthly_data[monthly_data["Month"] == month]
-        fig_pies.add_trace(
-            go.Pie(
-                labels=sub_df["Source"],
-                values=sub_df["Tokens"],
-                name=str(month),
-                textinfo="percent",
-                text=sub_df["Source"],
-                textposition="inside",
-                hovertemplate="%{label}: %{value:,.0f} tokens (%{percent})",
-                marker=dict(colors=px.colors.qualitative.Pastel),
-            ),
-            row=1,
-            col=i + 1,
+    pie_traces = [
+        dict(
+            type="pie",
+            labels=sub_df["Source"].values,
+            values=sub_df["Tokens"].values,
+            name=str(month),
+            textinfo="percent",
+            text=sub_df["Source"].values,
+            textposition="inside",
+            hovertemplate="%{label}: %{value:,.0f} tokens (%{percent})",
+            marker=dict(colors=px.colors.qualitative.Pastel),
         )
-        annotations.append(
-            dict(
-                x=(i + 0.5) / len(months),
-                y=-0.25,
-                text=f"<b style='font-size:16px'>Total: {int(sub_df['Tokens'].sum()):,}</b>",
-                showarrow=False,
-                xanchor="center",
-                font=dict(size=16),
-                xref="paper",
-                yref="paper",
-            )
+        for month, sub_df in monthly_data.groupby("Month", observed=True)
+    ]
+    fig_pies.add_traces(pie_traces, rows=[1] * len(months), cols=list(range(1, len(months) + 1)))
+    annotations = [
+        dict(
+            x=(i + 0.5) / len(months),
+            y=-0.25,
+            text=f"<b style='font-size:16px'>Total: {int(month_totals[month]):,}</b>",
+            showarrow=False,
+            xanchor="center",
+            font=dict(size=16),
+            xref="paper",
+            yref="paper",
         )
+        for i, month in enumerate(months)
+    ]
 
     fig_pies.update_layout(
         title_text=f"Monthly Token Distribution by Source (Total: {int(monthly_data['Tokens'].sum()):,})",
         margin=dict(t=100, b=80),
         annotations=fig_pies.layout.annotations + tuple(annotations),
     )
+    return fig_pies
+
+
+def create_figures():
+    # --- Shared aggregations (each sheet scanned once) ---
+    tsdf = tokens_source_df.loc[tokens_source_df["Date"].values >= CUTOFF]
+    token_source_cols = [
+        col for col in tsdf.select_dtypes(include="number").columns if col != "Total"
+    ]
+    monthly_tokens = month_sum(tsdf, tsdf.select_dtypes(include="number").columns.tolist())
+    monthly_tokens["MonthLabel"] = monthly_tokens["Month"].dt.strftime("%B %Y")  # For display only
+
+    if "Total" not in monthly_tokens.columns:
+        monthly_tokens["Total"] = monthly_tokens[token_source_cols].sum(axis=1)
+    total_tokens = monthly_tokens["Total"].sum()
+
+    wallet_df_filtered = wallet_df.loc[wallet_df["Date"].values > PRE_CUTOFF]
+    monthly_wallets = month_sum(wallet_df_filtered, ["Android", "iOS", "Web"])
+    platform_totals = monthly_wallets[["Android", "iOS", "Web"]].sum().astype(int)
+
+    rdf = referral_df.loc[referral_df["Date"].values >= CUTOFF]
+    referral_by_source = month_sum(rdf, referral_sources)
+    referral_totals = referral_by_source[referral_sources].sum().astype(int)
+    referral_by_source["Total"] = referral_by_source[referral_sources].sum(axis=1)
+
+    fdf = fee_df.loc[fee_df["Date"].values > PRE_CUTOFF]
+    monthly_fee = month_sum(fdf, ["TxnFee(POL)"])
+    total_fee = int(monthly_fee["TxnFee(POL)"].sum())
+
+    source_totals = tokens_source_df[token_source_cols].sum().reset_index()
+    source_totals.columns = ["Source", "Total Tokens"]
+
+    # --- Pie-subplot prep ---
+    tsdf = tokens_source_df.copy()
+    tsdf["Date"] = pd.to_datetime(tsdf["Date"], errors="coerce")
+    tsdf = tsdf.loc[tsdf["Date"].values >= CUTOFF].dropna(subset=["Date"])
+    tsdf["Month_dt"] = tsdf["Date"].to_numpy().astype("datetime64[M]").astype("datetime64[ns]")
+    tsdf["Month"] = tsdf["Month_dt"].dt.strftime("%b %Y")
+    tsdf = tsdf.sort_values("Month_dt")
+    month_order = tsdf["Month"].unique().tolist()
+    tsdf["Month"] = pd.Categorical(tsdf["Month"], categories=month_order, ordered=True)
 
-    return token_bar, token_line, wallet_pie, wallet_bar, referral_bar, referral_line, fee_line, token_source_bar, fig_pies
+    token_source_cols = [ col for col in tsdf.columns if col not in ["Date", "Month_dt", "Month", "Total"] and pd.api.types.is_numeric_dtype(tsdf[col]) ]
+    melted = tsdf.melt( id_vars="Month", value_vars=token_source_cols, var_name="Source", value_name="Tokens",)
+    monthly_data = (melted.groupby(["Month", "Source"], observed=True).sum().reset_index())
+    months = monthly_data["Month"].cat.categories.tolist()
+    month_totals = (monthly_data.groupby("Month", observed=True)["Tokens"].sum().to_dict())
 
-# --- Generate charts once ---
-token_bar, token_line, wallet_pie, wallet_bar, referral_bar, referral_line, fee_line, token_source_bar, fig_pies = create_figures()
+    # --- Build the nine figures in parallel ---
+    # threads, not loky: worker processes would re-import this module and
+    # re-trigger the whole load/figure pipeline
+    builds = [
+        delayed(_build_token_bar)(monthly_tokens, total_tokens),
+        delayed(_build_token_line)(monthly_tokens, total_tokens),
+        delayed(_build_wallet_pie)(platform_totals),
+        delayed(_build_wallet_bar)(monthly_wallets, platform_totals),
+        delayed(_build_referral_bar)(referral_by_source, referral_totals),
+        delayed(_build_referral_line)(referral_by_source),
+        delayed(_build_fee_line)(monthly_fee, total_fee),
+        delayed(_build_token_source_bar)(source_totals),
+        delayed(_build_fig_pies)(monthly_data, months, month_totals),
+    ]
+    return tuple(Parallel(n_jobs=-1, prefer="threads")(builds))
 
 # --- Dash App ---
 app = Dash(__name__, external_stylesheets=[dbc.themes.BOOTSTRAP],
@@ -264,42 +381,82 @@ app = Dash(__name__, external_stylesheets=[dbc.themes.BOOTSTRAP],
 )
 app.title = "Sharp Token Dashboard"
 
+cache = Cache(app.server, config=CACHE_CONFIG)
+
+FIGURE_IDS = [
+    "token-bar", "token-line", "wallet-pie", "wallet-bar",
+    "referral-bar", "referral-line", "fee-line", "token-source-bar", "fig-pies",
+]
+
+
+@cache.memoize()
+def figure_payloads(cache_key):
+    """Build all nine figures and return their pre-serialized JSON blobs."""
+    return [pio.to_json(fig) for fig in create_figures()]
+
+
+_warm_lock = threading.Lock()
+
+
+def warm_figures():
+    """Compute-and-cache the figure payloads; the lock stops a first request
+    from kicking off a second build while the warm-up is still running."""
+    with _warm_lock:
+        return figure_payloads(CACHE_KEY)
+
+
+def placeholder_graph(figure_id):
+    return dcc.Loading(dcc.Graph(id=figure_id, figure={}))
+
+
 app.layout = dbc.Container(
     [
+        dcc.Location(id="url"),
         html.H2("Sharp Token Dashboard", className="my-4 text-center"),
         dbc.Row(
             [
-                dbc.Col(dcc.Graph(figure=token_bar), md=6),
-                dbc.Col(dcc.Graph(figure=token_line), md=6),
+                dbc.Col(placeholder_graph("token-bar"), md=6),
+                dbc.Col(placeholder_graph("token-line"), md=6),
             ],
             className="mb-4",
         ),
         dbc.Row(
             [
-                dbc.Col(dcc.Graph(figure=wallet_pie), md=6),
-                dbc.Col(dcc.Graph(figure=wallet_bar), md=6),
+                dbc.Col(placeholder_graph("wallet-pie"), md=6),
+                dbc.Col(placeholder_graph("wallet-bar"), md=6),
             ],
             className="mb-4",
         ),
         dbc.Row(
             [
-                dbc.Col(dcc.Graph(figure=referral_bar), md=6),
-                dbc.Col(dcc.Graph(figure=referral_line), md=6),
+                dbc.Col(placeholder_graph("referral-bar"), md=6),
+                dbc.Col(placeholder_graph("referral-line"), md=6),
             ],
             className="mb-4",
         ),
         dbc.Row(
             [
-                dbc.Col(dcc.Graph(figure=fee_line), md=6),
-                dbc.Col(dcc.Graph(figure=token_source_bar), md=6),
+                dbc.Col(placeholder_graph("fee-line"), md=6),
+                dbc.Col(placeholder_graph("token-source-bar"), md=6),
             ],
             className="mb-4",
         ),
-        dbc.Row([dbc.Col(dcc.Graph(figure=fig_pies), md=12)], className="mb-4"),
+        dbc.Row([dbc.Col(placeholder_graph("fig-pies"), md=12)], className="mb-4"),
     ],
     fluid=False,
 )
 
+
+@app.callback([Output(figure_id, "figure") for figure_id in FIGURE_IDS], Input("url", "pathname"))
+def load_figures(_pathname):
+    # dcc.Graph accepts plain dicts, so skip rebuilding (and re-validating) Figure objects
+    return [orjson.loads(fig) for fig in warm_figures()]
+
+
+# Start building figures in the background so the server can bind and serve the
+# skeleton layout immediately; the first callback then finds a warm cache.
+threading.Thread(target=warm_figures, daemon=True).start()
+
 if __name__ == "__main__":
     port = int(os.environ.get("PORT", 80))
     app.run(host='0.0.0.0')